@@ -110,7 +110,7 @@ class SampleBoundaryCalculator(SelfInfluenceCalculator):
         y_computed = tf.argmax(y, axis=1)
 
         def update_grads():
-            jac = tape.jacobian(y, x)
+            jac = tape.jacobian(y, x, experimental_use_pfor=True)
 
             indexes_all = tf.repeat(tf.expand_dims(tf.range(0, tf.shape(y)[1]), axis=0), tf.shape(y)[0], axis=0)
             indexes_class = tf.cast(tf.repeat(tf.expand_dims(y_pred, axis=1), tf.shape(y)[1], axis=1), dtype=tf.int32)
@@ -132,7 +132,7 @@ class WeightsBoundaryCalculator(SelfInfluenceCalculator):
 
         def update_grads():
             model_weights = self.model.trainable_variables
-            jac = tape.jacobian(y, self.model.trainable_variables)
+            jac = tape.jacobian(y, self.model.trainable_variables, experimental_use_pfor=True)
 
             indexes_all = tf.repeat(tf.expand_dims(tf.range(0, tf.shape(y)[1]), axis=0), tf.shape(y)[0], axis=0)
             indexes_class = tf.cast(tf.repeat(tf.expand_dims(y_pred, axis=1), tf.shape(y)[1], axis=1), dtype=tf.int32)
@@ -103,11 +103,11 @@ class SelfInfluenceCalculator:
         influences_values = influences_values.map(
             lambda _, inf_val: inf_val
         )
-        inf_val = None
-        for batch_inf in influences_values:
-            inf_val = batch_inf if inf_val is None else tf.concat([inf_val, batch_inf], axis=0)
+        # Gather the batches and concatenate once at the end: growing the tensor inside the
+        # loop would copy the whole accumulated result on every iteration
+        inf_val = [batch_inf for batch_inf in influences_values]
 
-        return inf_val
+        return tf.concat(inf_val, axis=0) if inf_val else None
 
     def compute_top_k_from_training_dataset(
             self,
@@ -141,12 +141,34 @@ class SelfInfluenceCalculator:
         elt_spec = train_set.element_spec[0]
         batch_sorted_dict = BatchSort(elt_spec.shape[1:], (1, k), dtype=elt_spec.dtype, order=order)
 
-        for batch in train_set:
+        def score_batch(batch):
             influence_values = self._compute_influence_value_from_batch(batch)
             if len(influence_values.shape) == 1:
                 influence_values = tf.expand_dims(influence_values, axis=-1)
             batch_sorted_dict.add_all(tf.expand_dims(batch[0], axis=0), tf.transpose(influence_values))
 
+        nb_batches = train_set.cardinality()
+        if nb_batches == tf.data.UNKNOWN_CARDINALITY or nb_batches == tf.data.INFINITE_CARDINALITY:
+            # The graph-level loop below needs a known trip count; datasets that cannot
+            # report one (e.g. after filter or from_generator) keep the plain eager sweep
+            for batch in train_set:
+                score_batch(batch)
+        else:
+            dataset_iterator = iter(train_set)
+
+            def body_func(i):
+                score_batch(next(dataset_iterator))
+
+                return (i + 1, )
+
+            # Iterate inside a graph-level loop, as in LinearNearestNeighbors.query, so that the
+            # per-batch scoring and top-k merge are not interleaved with Python dispatch
+            tf.while_loop(
+                cond=lambda i: i < nb_batches,
+                body=body_func,
+                loop_vars=[tf.constant(0, dtype=tf.int64)]
+            )
+
         best_samples, best_values = batch_sorted_dict.get()
         influence_values = tf.stack(best_values)
         training_samples = tf.concat(
@@ -351,6 +373,8 @@ class BaseInfluenceCalculator(SelfInfluenceCalculator):
 
         if influence_vector_in_cache == CACHE.MEMORY:
             inf_vect_ds = inf_vect_ds.cache()
+        # Overlap the (possibly expensive) influence vector computation with its consumption
+        inf_vect_ds = inf_vect_ds.prefetch(tf.data.AUTOTUNE)
 
         influence_value_dataset = map_to_device(dataset_to_evaluate,
                                                 lambda *batch_evaluate: self._estimate_inf_values_with_inf_vect_dataset(
@@ -433,6 +457,8 @@ class BaseInfluenceCalculator(SelfInfluenceCalculator):
 
         if influence_vector_in_cache == CACHE.MEMORY:
             inf_vect_ds = inf_vect_ds.cache()
+        # Overlap the (possibly expensive) influence vector computation with the linear search
+        inf_vect_ds = inf_vect_ds.prefetch(tf.data.AUTOTUNE)
 
         batch_size_eval = int(dataset_to_evaluate._batch_size)  # pylint: disable=W0212
         nearest_neighbors.build(
@@ -482,9 +508,12 @@ class BaseInfluenceCalculator(SelfInfluenceCalculator):
             batch of the training dataset
             influence scores
         """
+        # Pre-process the evaluation batch once: its gradients do not depend on the
+        # training batch, so there is no need to recompute them for each influence vector batch
+        v_to_evaluate = self._preprocess_samples(samples_to_evaluate)
         samples_inf_val_dataset = map_to_device(inf_vect_dataset, lambda *batch:
                     (batch[:-1][0],
-                     self._estimate_influence_values_from_influence_vector(samples_to_evaluate, batch[-1])), device)
+                     self._estimate_influence_value_from_influence_vector(v_to_evaluate, batch[-1])), device)
         return samples_to_evaluate, samples_inf_val_dataset
 
     def _top_k_with_inf_vect_dataset_train(
@@ -528,37 +557,7 @@ class BaseInfluenceCalculator(SelfInfluenceCalculator):
 
         return sample_to_evaluate, influences_values, training_samples
 
-    def _estimate_influence_values_from_influence_vector(
-            self,
-            samples_to_evaluate: Tuple[tf.Tensor, ...],
-            inf_vect: tf.Tensor
-    ) -> tf.Tensor:
-        """
-        Internal function to optimize computations when the influence vectors have already been calculated.
-
-        Computes the influence values between each of the test samples and one influence vector from the training
-        dataset.
-
-        Parameters
-        ----------
-        samples_to_evaluate
-            A single batch of test samples for which we wish to compute the influence of leaving out the training
-            data-points corresponding to the influence vector.
-        inf_vect
-            A tensor with one influence vector
-
-        Returns
-        -------
-        Tuple:
-            batch of the training dataset
-            influence vector
-        """
-        v_to_evaluate = self._preprocess_samples(samples_to_evaluate)
-        value = self._estimate_influence_value_from_influence_vector(v_to_evaluate, inf_vect)
-
-        return value
-
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _estimate_individual_influence_values_from_batch(
             self,
             train_samples: Tuple[tf.Tensor, ...],
@@ -18,7 +18,8 @@ from tensorflow.keras.models import Sequential  # pylint: disable=E0611
 from .model_wrappers import BaseInfluenceModel, InfluenceModel
 
 from ..types import Optional, Union, Tuple, List, Callable
-from ..utils import assert_batched_dataset, conjugate_gradients_solve, map_to_device
+from ..utils import assert_batched_dataset, conjugate_gradients_solve
+from ..utils.tf_operations import get_device
 
 
 class InverseHessianVectorProduct(ABC):
@@ -164,48 +165,182 @@ class ExactIHVP(InverseHessianVectorProduct):
         The estimated hessian matrix of the model's loss wrt its parameters computed with
         the samples used for the model's training. Either hessian or train_dataset should
         not be None but not both.
+    damping
+        A float with an optional Tikhonov regularization term added to the hessian's
+        diagonal before factorizing it. Besides the usual stabilizing effect, a positive
+        damping makes the matrix positive-definite and thus amenable to the (cheaper)
+        Cholesky factorization.
+    hessian_dtype
+        An optional reduced-precision dtype (e.g. tf.bfloat16) in which to store the
+        (nb_params, nb_params) hessian and its inverse, halving the memory they move on
+        every product. The hessian is still accumulated and factorized in the working
+        precision, and the IHVPs are cast back to the gradients' dtype. None (the
+        default) keeps full precision.
+    use_gauss_newton
+        A boolean indicating whether to approximate the hessian with the (outer-product)
+        Gauss-Newton matrix, accumulated as one matmul of the per-example gradients per
+        batch. Much cheaper than the nb_params hessian-vector products of the exact
+        computation, positive semi-definite by construction, and a close approximation
+        around a converged model.
     """
     def __init__(
             self,
             model: InfluenceModel,
             train_dataset: Optional[tf.data.Dataset] = None,
             train_hessian: Optional[tf.Tensor] = None,
+            damping: float = 0.,
+            hessian_dtype: Optional[tf.DType] = None,
+            use_gauss_newton: bool = False
     ):
         super().__init__(model, train_dataset)
+        self.damping = damping
+        self.use_gauss_newton = use_gauss_newton
         if train_dataset is not None:
             nb_batch = tf.cast(train_dataset.cardinality(), dtype=tf.int32)
-            self.inv_hessian = self._compute_inv_hessian(self.train_set, nb_batch)
-            self.hessian = None
+            # Cache the hessian alongside its inverse: recovering it later through a
+            # second inversion would both cost another O(n^3) factorization and degrade precision
+            self._hessian = self._compute_hessian(self.train_set, nb_batch)
         elif train_hessian is not None:
-            self.hessian = train_hessian
-            self.inv_hessian = tf.linalg.pinv(train_hessian)
+            self._hessian = train_hessian
         else:
             raise ArgumentError("Either train_dataset or train_hessian can be set to None, but not both")
 
+        if damping > 0.:
+            self._hessian += damping * tf.eye(tf.shape(self._hessian)[0], dtype=self._hessian.dtype)
+
+        # Keep the Cholesky factor (when the possibly damped hessian is positive-definite)
+        # for the cheap and stable back-substitution solves of the IHVP hot path
+        cholesky = tf.linalg.cholesky(self._hessian)
+        self._cholesky = cholesky if bool(tf.reduce_all(tf.math.is_finite(cholesky))) else None
+
+        # The explicit inverse, however, must be at pseudo-inverse accuracy: an inverse
+        # built by back-substituting the identity against the factor drifts on
+        # ill-conditioned hessians. The hessian is symmetric, so an eigendecomposition
+        # (with the near-null eigenvalues truncated) matches pinv at a fraction of the
+        # cost of its SVD
+        eigvals, eigvecs = tf.linalg.eigh(self._hessian)
+        tol = tf.reduce_max(tf.abs(eigvals)) * \
+              tf.cast(tf.shape(self._hessian)[0], dtype=eigvals.dtype) * \
+              tf.constant(tf.experimental.numpy.finfo(eigvals.dtype).eps, dtype=eigvals.dtype)
+        inv_eigvals = tf.where(tf.abs(eigvals) > tol,
+                               tf.math.divide_no_nan(tf.ones_like(eigvals), eigvals),
+                               tf.zeros_like(eigvals))
+        self.inv_hessian = tf.matmul(eigvecs * inv_eigvals, eigvecs, transpose_b=True)
+
+        if hessian_dtype is not None and hessian_dtype != self._hessian.dtype:
+            # Keep only the reduced-precision copies around: the factorization above already
+            # happened in the working precision, and the back-substitution has no half-precision
+            # kernel anyway, so the products go through the (cast) explicit inverse instead
+            self._hessian = tf.cast(self._hessian, dtype=hessian_dtype)
+            self.inv_hessian = tf.cast(self.inv_hessian, dtype=hessian_dtype)
+            self._cholesky = None
+
+    @property
+    def hessian(self) -> tf.Tensor:
+        """
+        The estimated hessian matrix. It is computed and cached at construction; the
+        (pseudo)-inverse fallback only applies if the attribute was manually cleared.
+
+        Returns
+        -------
+        hessian
+            A tf.Tensor with the estimated hessian matrix.
+        """
+        if self._hessian is None:
+            with tf.init_scope():
+                self._hessian = tf.linalg.pinv(self.inv_hessian)
+        return self._hessian
+
+    @hessian.setter
+    def hessian(self, value: tf.Tensor) -> None:
+        self._hessian = value
+
+    @tf.function(experimental_relax_shapes=True, jit_compile=True)
+    def _batch_hessian(self, batch: Tuple[tf.Tensor, ...]) -> tf.Tensor:
+        """
+        Computes the (summed, not averaged) hessian of the model's loss over a single
+        batch of samples, column by column, through forward-over-backward hessian-vector
+        products against the standard basis vectors (Pearlmutter's trick). Being its own
+        tf.function, the per-batch graph is traced once and reused across all batches.
+
+        Parameters
+        ----------
+        batch
+            A single batch of training samples (with their labels).
+
+        Returns
+        -------
+        batch_hessian
+            A tf.Tensor with the summed hessian over the batch's samples.
+        """
+        weights = self.model.weights
+        weight_sizes = [int(tf.reduce_prod(w.shape)) for w in weights]
+        model_inp, y_true, sample_weight = self.model.process_batch_for_loss_fn(batch)
+        d_type = model_inp.dtype
+
+        def hessian_column(tangent):
+            tangents = [tf.reshape(t, w.shape) for t, w in
+                        zip(tf.split(tf.cast(tangent, dtype=weights[0].dtype), weight_sizes), weights)]
+            with tf.autodiff.ForwardAccumulator(weights, tangents) as acc:
+                with tf.GradientTape(watch_accessed_variables=False) as tape:
+                    tape.watch(weights)
+                    loss = self.model.loss_function(y_true, self.model.model(model_inp), sample_weight)
+                grads = tape.gradient(loss, weights)
+            jvps = acc.jvp(grads)
+            return tf.cast(tf.concat([tf.reshape(j, (-1,)) for j in jvps], axis=0), dtype=d_type)
+
+        # Each product yields one column H e_i of the summed per-batch hessian, and the
+        # matrix is symmetric, so stacking them recovers the full hessian
+        batch_hessian = tf.map_fn(hessian_column, tf.eye(self.model.nb_params, dtype=d_type),
+                                  fn_output_signature=d_type)
+
+        return batch_hessian
+
+    @tf.function(experimental_relax_shapes=True)
+    def _batch_gauss_newton(self, batch: Tuple[tf.Tensor, ...]) -> tf.Tensor:
+        """
+        Computes the (summed, not averaged) Gauss-Newton approximation of the hessian over
+        a single batch of samples as the outer product of the per-example gradients: one
+        matmul per batch, with an O(nb_params^2) peak instead of the per-column
+        hessian-vector products of the exact computation.
+
+        Parameters
+        ----------
+        batch
+            A single batch of training samples (with their labels).
+
+        Returns
+        -------
+        batch_gauss_newton
+            A tf.Tensor with the summed Gauss-Newton matrix over the batch's samples.
+        """
+        grads = tf.reshape(self.model.batch_jacobian_tensor(batch), (-1, self.model.nb_params))
+
+        return tf.matmul(grads, grads, transpose_a=True)
+
     @tf.function
-    def _compute_inv_hessian(self, dataset: tf.data.Dataset, nb_batch: tf.int32) -> tf.Tensor:
+    def _compute_hessian(self, dataset: tf.data.Dataset, nb_batch: tf.int32) -> tf.Tensor:
         """
-        Compute the (pseudo)-inverse of the hessian matrix wrt to the model's parameters using
-        backward-mode AD.
+        Compute the hessian matrix of the model's loss wrt its parameters by accumulating
+        per-batch hessians over the dataset.
 
         Disclaimer
         ----------
-        This implementation trades memory usage for speed, so it can be quite
-        memory intensive, especially when dealing with big models.
+        The nb_params hessian-vector products per batch still make this only feasible for
+        models with a moderate amount of parameters, but no
+        (batch_size, nb_params, nb_params) intermediate is ever materialized.
 
         Parameters
         ----------
         dataset
             A TF dataset containing the whole or part of the training dataset for the
-            computation of the inverse of the mean hessian matrix.
+            computation of the mean hessian matrix.
 
         Returns
         ----------
-        inv_hessian
-            A tf.Tensor with the resulting inverse hessian matrix
+        hessian
+            A tf.Tensor with the resulting hessian matrix
         """
-        weights = self.model.weights
-
         hess = tf.zeros((self.model.nb_params, self.model.nb_params), dtype=dataset.element_spec[0].dtype)
         nb_elt = tf.constant(0, dtype=tf.int32)
         nb_batch_saw = tf.constant(0, dtype=tf.int32)
@@ -216,19 +351,10 @@ class ExactIHVP(InverseHessianVectorProduct):
             nb_batch_saw += tf.constant(1, dtype=tf.int32)
             curr_nb_elt = tf.shape(batch[0])[0]
             nb_elt += curr_nb_elt
-            with tf.GradientTape(persistent=True, watch_accessed_variables=False) as tape_hess:
-                tape_hess.watch(weights)
-                grads = self.model.batch_jacobian_tensor(batch) # pylint: disable=W0212
-
-            curr_hess = tape_hess.jacobian(
-                    grads, weights
-                    )
-
-            curr_hess = [tf.reshape(h, shape=(len(grads), self.model.nb_params, -1)) for h in curr_hess]
-            curr_hess = tf.concat(curr_hess, axis=-1)
-            curr_hess = tf.reshape(curr_hess, shape=(len(grads), self.model.nb_params, -1))
-            curr_hess = tf.reduce_sum(curr_hess, axis=0)
-            hess += tf.cast(curr_hess, dtype=hess.dtype)
+            if self.use_gauss_newton:
+                hess += tf.cast(self._batch_gauss_newton(batch), dtype=hess.dtype)
+            else:
+                hess += tf.cast(self._batch_hessian(batch), dtype=hess.dtype)
 
             return nb_elt, nb_batch_saw, hess
 
@@ -240,9 +366,9 @@ class ExactIHVP(InverseHessianVectorProduct):
 
         hessian = hess / tf.cast(nb_elt, dtype=hess.dtype)
 
-        return tf.linalg.pinv(hessian)
+        return hessian
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _compute_ihvp_single_batch(self, group_batch: Tuple[tf.Tensor, ...], use_gradient: bool = True) -> tf.Tensor:
         """
         Computes the inverse-hessian-vector product of a group of points provided in the form of
@@ -268,10 +394,17 @@ class ExactIHVP(InverseHessianVectorProduct):
         else:
             grads = tf.reshape(group_batch[0], (-1, self.model.nb_params))
 
-        ihvp = tf.matmul(self.inv_hessian, tf.cast(grads, dtype=self.inv_hessian.dtype), transpose_b=True)
-        return ihvp
+        d_type = grads.dtype
+        grads = tf.cast(grads, dtype=self.inv_hessian.dtype)
+        if self._cholesky is not None:
+            # Back-substitution against the cached factor: O(P^2) per RHS and more stable
+            # than multiplying by an explicitly formed inverse
+            ihvp = tf.linalg.cholesky_solve(self._cholesky, tf.transpose(grads))
+        else:
+            ihvp = tf.matmul(self.inv_hessian, grads, transpose_b=True)
+        return tf.cast(ihvp, dtype=d_type)
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _compute_hvp_single_batch(self, group_batch: Tuple[tf.Tensor, ...], use_gradient: bool = True) -> tf.Tensor:
         """
         Computes the hessian-vector product of a group of points provided in the form of a tuple
@@ -296,9 +429,9 @@ class ExactIHVP(InverseHessianVectorProduct):
         else:
             grads = tf.reshape(group_batch[0], (-1, self.model.nb_params))
 
-        hvp = tf.matmul(self.hessian, grads, transpose_b=True)
+        hvp = tf.matmul(self.hessian, tf.cast(grads, dtype=self.hessian.dtype), transpose_b=True)
 
-        return hvp
+        return tf.cast(hvp, dtype=grads.dtype)
 
     def compute_hvp(self, group: tf.data.Dataset, use_gradient: bool = True) -> tf.data.Dataset:
         """
@@ -319,8 +452,6 @@ class ExactIHVP(InverseHessianVectorProduct):
         hvp
             A tensor containing one rank-1 tensor per input point
         """
-        if self.hessian is None:
-            self.hessian = tf.linalg.pinv(self.inv_hessian)
         return super().compute_hvp(group, use_gradient)
 
 
@@ -338,24 +469,58 @@ class ForwardOverBackwardHVP:
         A (batched) TF dataset with the data-points that will be used for the hessian.
     weights
         The target weights on which to calculate the HVP.
+    use_finite_diff_hvp
+        A boolean indicating whether to approximate the HVP through central finite
+        differences of the gradient instead of forward-over-backward AD. Two gradient
+        evaluations per product, useful when the forward accumulator falls back to slow
+        paths (or runs out of memory) on some layer types.
+    hessian_subsample_frac
+        A float in (0, 1] with the fraction of the training points to sample (uniformly,
+        anew on each operator application) for estimating the hessian, in the spirit of
+        sub-sampled Newton methods. The default of 1. uses the whole set.
     """
     def __init__(
             self,
             model: BaseInfluenceModel,
             train_dataset: tf.data.Dataset,
-            weights: Optional[List[tf.Tensor]] = None
+            weights: Optional[List[tf.Tensor]] = None,
+            use_finite_diff_hvp: bool = False,
+            hessian_subsample_frac: float = 1.
     ):
+        assert 0. < hessian_subsample_frac <= 1., "hessian_subsample_frac must be in (0, 1]"
+        self.use_finite_diff_hvp = use_finite_diff_hvp
+        self.hessian_subsample_frac = hessian_subsample_frac
         self.model = model
         self.train_dataset = train_dataset
-        self.cardinality = train_dataset.cardinality()
+
+        # Materialize the training points once: the operator is applied n_opt_iters times
+        # per solve, and a single resident tensor lets each application be one HVP over the
+        # whole set instead of a loop of per-batch tape constructions
+        features, labels = [], []
+        for x_batch, y_batch in train_dataset:
+            features.append(x_batch)
+            labels.append(y_batch)
+        self._train_features = tf.concat(features, axis=0)
+        self._train_labels = tf.concat(labels, axis=0)
+        self.n_hessian = tf.shape(self._train_features)[0]
 
         if weights is None:
             self.weights = model.weights
         else:
             self.weights = weights
 
-    @staticmethod
-    def _reshape_vector(grads: tf.Tensor, weights: tf.Tensor) -> List[tf.Tensor]:
+        # Constants of the hot path, hoisted out of it: the weights' static shapes and the
+        # normalization factor do not change between operator applications
+        self._weight_shapes = [w.shape for w in self.weights]
+        self._weight_sizes = [int(tf.reduce_prod(s)) for s in self._weight_shapes]
+        if hessian_subsample_frac < 1.:
+            self._subsample_size = max(int(int(self.n_hessian) * hessian_subsample_frac), 1)
+            self._nb_hessian_cast = tf.cast(self._subsample_size, dtype=self.weights[0].dtype)
+        else:
+            self._subsample_size = None
+            self._nb_hessian_cast = tf.cast(self.n_hessian, dtype=self.weights[0].dtype)
+
+    def _reshape_vector(self, grads: tf.Tensor) -> List[tf.Tensor]:
         """
         Reshapes the gradient vector to the right shape for being input into the HVP computation.
 
@@ -363,25 +528,17 @@ class ForwardOverBackwardHVP:
         ----------
         grads
             A tensor with the computed gradients.
-        weights
-            A tensor with the target weights.
 
         Returns
         -------
         grads_reshape
             A list with the gradients in the right shape.
         """
-        grads_reshape = []
-        index = 0
-        for w in weights:
-            shape = tf.shape(w)
-            size = tf.reduce_prod(shape)
-            g = grads[index:(index + size)]
-            grads_reshape.append(tf.reshape(g, shape))
-            index += size
-        return grads_reshape
+        # A single split against the pre-computed static sizes: no runtime shape ops
+        splits = tf.split(grads, self._weight_sizes)
+        return [tf.reshape(g, shape) for g, shape in zip(splits, self._weight_shapes)]
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _sub_call(
             self,
             x: tf.Tensor,
@@ -389,22 +546,24 @@ class ForwardOverBackwardHVP:
             y_hessian_current: tf.Tensor
     ) -> tf.Tensor:
         """
-        Performs the hessian-vector product for a single feature map.
+        Performs the hessian-vector product for a batch of feature maps. The sum of the
+        per-example hessians is the hessian of the summed loss, so a single backward pass
+        over the batch under the forward accumulator yields the summed HVP directly,
+        without any per-example dispatch.
 
         Parameters
         ----------
         x
             The gradient vector to be multiplied by the hessian matrix.
         feature_maps_hessian_current
-            The current feature map for the hessian calculation.
+            The batch of feature maps for the hessian calculation.
         y_hessian_current
-            The label corresponding to the current feature map.
+            The labels corresponding to the batch of feature maps.
 
         Returns
         -------
         hessian_vector_product
-            A tf.Tensor containing the result of the hessian-vector product for a given input point and one pair
-            feature map-label.
+            A tf.Tensor containing the sum over the batch of the hessian-vector products.
         """
         with tf.autodiff.ForwardAccumulator(
                 self.weights,
@@ -413,62 +572,105 @@ class ForwardOverBackwardHVP:
             with tf.GradientTape(persistent=False, watch_accessed_variables=False) as tape:
                 tape.watch(self.weights)
                 loss = self.model.loss_function(y_hessian_current, self.model(feature_maps_hessian_current))
-            backward = tape.jacobian(loss, self.weights)
+            # The gradient of the (unreduced) loss vector is the gradient of its sum
+            backward = tape.gradient(loss, self.weights)
         hessian_vector_product = acc.jvp(backward)
 
         hvp = [tf.reshape(hessian_vp, shape=(-1,)) for hessian_vp in hessian_vector_product]
         hvp = tf.concat(hvp, axis=0)
 
-        weight = tf.cast(tf.shape(feature_maps_hessian_current)[0], dtype=hvp.dtype)
-
-        hvp = hvp * weight
-
         return hvp
 
-    def __call__(self, x_initial: tf.Tensor) -> tf.Tensor:
+    @tf.function(experimental_relax_shapes=True)
+    def _sub_call_finite_diff(
+            self,
+            x: tf.Tensor,
+            feature_maps_hessian_current: tf.Tensor,
+            y_hessian_current: tf.Tensor
+    ) -> tf.Tensor:
         """
-        Computes the mean hessian-vector product for a given feature map over a set of points.
+        Approximates the hessian-vector product for a batch of feature maps through central
+        finite differences of the gradient: H v ~ (grad(w + h v) - grad(w - h v)) / 2h with
+        h scaled to the weights' norm. Costs exactly two gradient evaluations, whatever the
+        model's layers.
 
         Parameters
         ----------
-        x_initial
-            The point of the dataset over which this product will be computed
+        x
+            The gradient vector to be multiplied by the hessian matrix.
+        feature_maps_hessian_current
+            The batch of feature maps for the hessian calculation.
+        y_hessian_current
+            The labels corresponding to the batch of feature maps.
 
         Returns
         -------
         hessian_vector_product
-            Tensor with the hessian-vector product
+            A tf.Tensor containing the sum over the batch of the hessian-vector products.
         """
-        x = self._reshape_vector(x_initial, self.model.weights)
+        # The usual central-difference step: sqrt of the machine epsilon (so the round-off
+        # and truncation errors balance for the working precision), scaled to the weights
+        d_type = self.weights[0].dtype
+        h = tf.sqrt(tf.constant(tf.experimental.numpy.finfo(d_type).eps, dtype=d_type)) * \
+            (1. + tf.linalg.global_norm(self.weights))
+
+        def perturbed_gradient(sign):
+            for weight, direction in zip(self.weights, x):
+                weight.assign_add(sign * h * tf.cast(direction, dtype=weight.dtype))
+            with tf.GradientTape(watch_accessed_variables=False) as tape:
+                tape.watch(self.weights)
+                loss = self.model.loss_function(y_hessian_current, self.model(feature_maps_hessian_current))
+            gradient = tape.gradient(loss, self.weights)
+            for weight, direction in zip(self.weights, x):
+                weight.assign_sub(sign * h * tf.cast(direction, dtype=weight.dtype))
+            return gradient
 
-        hvp_init = tf.zeros((self.model.nb_params,), dtype=x_initial.dtype)
-        dataset_iterator = iter(self.train_dataset)
+        grads_plus = perturbed_gradient(tf.constant(1., dtype=h.dtype))
+        grads_minus = perturbed_gradient(tf.constant(-1., dtype=h.dtype))
 
-        def body_func(i, hessian_vector_product, nb_hessian):
-            features_block, labels_block = next(dataset_iterator)
+        hvp = [tf.reshape((g_plus - g_minus) / (2. * h), shape=(-1,))
+               for g_plus, g_minus in zip(grads_plus, grads_minus)]
+        hvp = tf.concat(hvp, axis=0)
 
-            def batched_hvp(elt):
-                f, l = elt
-                hessian_product_current = self._sub_call(x, tf.expand_dims(f, axis=0), tf.expand_dims(l, axis=0))
+        return hvp
 
-                return hessian_product_current
+    def __call__(self, x_initial: tf.Tensor) -> tf.Tensor:
+        """
+        Computes the mean hessian-vector product over a set of points, either for a single
+        vector or for a matrix with one vector per column. Each column costs a single
+        forward-over-backward pass over the whole (resident) training set, so solvers with
+        several right-hand sides pay no per-batch tape construction at all.
 
-            hessian_vector_product_inner = tf.reduce_sum(
-                tf.map_fn(fn=batched_hvp, elems=[features_block, labels_block], fn_output_signature=x_initial.dtype),
-                axis=0
-            )
+        Parameters
+        ----------
+        x_initial
+            A tensor with the vector (or [nb_params, n] matrix of column-vectors) with which
+            the hessian will be multiplied.
 
-            hessian_vector_product += hessian_vector_product_inner
-            return i + 1, hessian_vector_product, nb_hessian + tf.shape(features_block)[0]
+        Returns
+        -------
+        hessian_vector_product
+            Tensor with the hessian-vector product, of shape [nb_params, n].
+        """
+        x_columns = tf.transpose(tf.reshape(x_initial, (self.model.nb_params, -1)))
 
-        _, hessian_vector_product, nb_hessian = tf.while_loop(
-            cond=lambda i, _, __: i < self.cardinality,
-            body=body_func,
-            loop_vars=[tf.constant(0, dtype=tf.int64), hvp_init, tf.constant(0, dtype=tf.int32)]
-        )
+        if self._subsample_size is not None:
+            # One draw per operator application, shared by all the columns
+            indices = tf.random.shuffle(tf.range(self.n_hessian))[:self._subsample_size]
+            features = tf.gather(self._train_features, indices)
+            labels = tf.gather(self._train_labels, indices)
+        else:
+            features, labels = self._train_features, self._train_labels
 
-        hessian_vector_product = tf.reshape(hessian_vector_product, (self.model.nb_params, 1)) / \
-                                 tf.cast(nb_hessian, dtype=hessian_vector_product.dtype)
+        def column_hvp(x_col):
+            x = self._reshape_vector(x_col)
+            if self.use_finite_diff_hvp:
+                return self._sub_call_finite_diff(x, features, labels)
+            return self._sub_call(x, features, labels)
+
+        hessian_vector_product = tf.map_fn(fn=column_hvp, elems=x_columns)
+
+        hessian_vector_product = tf.transpose(hessian_vector_product) / self._nb_hessian_cast
 
         return hessian_vector_product
 
@@ -498,6 +700,12 @@ class IterativeIHVP(InverseHessianVectorProduct):
     feature_extractor
         If the feature extraction model is not Sequential, the full TF graph must be provided for the computation of
         the different feature maps.
+    use_finite_diff_hvp
+        A boolean indicating whether the hessian-vector products should be approximated through
+        finite differences of the gradient instead of forward-over-backward AD.
+    hessian_subsample_frac
+        A float in (0, 1] with the fraction of the training points to sample (anew on each
+        operator application) for estimating the hessian. The default of 1. uses the whole set.
     """
     def __init__(
             self,
@@ -507,6 +715,8 @@ class IterativeIHVP(InverseHessianVectorProduct):
             train_dataset: tf.data.Dataset,
             n_opt_iters: Optional[int] = 100,
             feature_extractor: Optional[Model] = None,
+            use_finite_diff_hvp: bool = False,
+            hessian_subsample_frac: float = 1.,
     ):
         super().__init__(model, train_dataset)
         self.n_opt_iters = n_opt_iters
@@ -528,7 +738,9 @@ class IterativeIHVP(InverseHessianVectorProduct):
             weights_processed=True
         )  # model that predicts based on the extracted feature maps
         self.weights = self.model.weights
-        self.hessian_vector_product = ForwardOverBackwardHVP(self.model, self.train_set, self.weights)
+        self.hessian_vector_product = ForwardOverBackwardHVP(self.model, self.train_set, self.weights,
+                                                             use_finite_diff_hvp=use_finite_diff_hvp,
+                                                             hessian_subsample_frac=hessian_subsample_frac)
         self.iterative_function = iterative_function
 
     def batch_shape_tensor(self):
@@ -540,7 +752,9 @@ class IterativeIHVP(InverseHessianVectorProduct):
     def _compute_feature_map_dataset(self, dataset: tf.data.Dataset) -> tf.data.Dataset:
         """
         Extracts the feature maps for an entire dataset and creates a TF dataset associating them with
-        their corresponding labels.
+        their corresponding labels. The feature maps are materialized once into resident tensors, as
+        the resulting dataset is swept on every operator application of the iterative solvers and
+        should not pay the extractor (nor the cache bookkeeping) on that hot path.
         Parameters
         ----------
         dataset
@@ -551,13 +765,51 @@ class IterativeIHVP(InverseHessianVectorProduct):
             A TF dataset with the pairs (feature_maps, labels), batched using the same batch_size as the one provided
             as input
         """
-        feature_map_dataset = map_to_device(dataset, lambda x_batch, y: (self.feature_extractor(x_batch), y)).cache()
+        batch_size = dataset._batch_size  # pylint: disable=W0212
+
+        # Running the extractor inside the input pipeline overlaps it with the dataset's own
+        # I/O and deserialization instead of alternating between the two batch by batch
+        extraction_pipeline = dataset.map(
+            lambda x_batch, y_batch: (self.feature_extractor(x_batch), y_batch),
+            num_parallel_calls=tf.data.AUTOTUNE
+        ).prefetch(tf.data.AUTOTUNE)
+
+        feature_maps, labels = [], []
+        with tf.device(get_device(None)):
+            for x_batch, y_batch in extraction_pipeline:
+                feature_maps.append(x_batch)
+                labels.append(y_batch)
+        feature_maps = tf.concat(feature_maps, axis=0)
+        labels = tf.concat(labels, axis=0)
+
+        feature_map_dataset = tf.data.Dataset.from_tensor_slices((feature_maps, labels)).batch(batch_size)
 
         if self._batch_shape_tensor is None:
             self._batch_shape_tensor = tf.shape(next(iter(feature_map_dataset))[0])
 
         return feature_map_dataset
 
+    @tf.function(experimental_relax_shapes=True)
+    def _batch_gradients_from_inputs(self, group_batch: Tuple[tf.Tensor, ...]) -> tf.Tensor:
+        """
+        Extracts the feature maps of a batch of raw input points and computes the
+        per-example gradients on them, inside a single traced graph so that the two
+        forward passes are fused instead of dispatched separately.
+
+        Parameters
+        ----------
+        group_batch
+            A single batch of raw input points (with their labels).
+
+        Returns
+        -------
+        gradients
+            A tf.Tensor with one gradient per input point.
+        """
+        feature_maps = self.feature_extractor(group_batch[0])
+
+        return self.model.batch_jacobian_tensor((feature_maps, *group_batch[1:]))
+
     def _compute_ihvp_single_batch(self, group_batch: Tuple[tf.Tensor, ...], use_gradient: bool = True) -> tf.Tensor:
         """
         Computes the inverse-hessian-vector product of a group of points provided in the form of
@@ -578,24 +830,16 @@ class IterativeIHVP(InverseHessianVectorProduct):
         """
         # Transform the dataset into a set of feature maps-labels
         if use_gradient:
-            feature_maps = self.feature_extractor(group_batch[0])
-            grads = self.model.batch_jacobian_tensor((feature_maps, *group_batch[1:]))
+            grads = self._batch_gradients_from_inputs(group_batch)
         else:
             grads = tf.reshape(group_batch[0], (-1, self.model.nb_params))
 
-        # Compute the IHVP for each pair feature map-label
-        def cgd_func(single_grad):
-            inv_hessian_vect_product = self.iterative_function(self.hessian_vector_product,
-                                                               tf.expand_dims(single_grad, axis=-1),
-                                                               self.n_opt_iters)
-            return inv_hessian_vect_product
-
-        ihvp_list = tf.map_fn(fn=cgd_func, elems=grads)
-
-        ihvp_list = tf.transpose(ihvp_list) if ihvp_list.shape[-1] != 1 \
-            else tf.transpose(tf.squeeze(ihvp_list, axis=-1))
+        # Solve against all the points' gradients at once: the iterative solvers are linear
+        # in their right-hand side and their operator shares the train-set sweep across
+        # columns, so one block solve replaces a full solve per point
+        ihvp = self.iterative_function(self.hessian_vector_product, tf.transpose(grads), self.n_opt_iters)
 
-        return ihvp_list
+        return ihvp
 
     def _compute_hvp_single_batch(self, group_batch: Tuple[tf.Tensor, ...], use_gradient: bool = True) -> tf.Tensor:
         """
@@ -616,21 +860,15 @@ class IterativeIHVP(InverseHessianVectorProduct):
         """
         # Transform the dataset into a set of feature maps-labels
         if use_gradient:
-            feature_maps = self.feature_extractor(group_batch[0])
-            grads = self.model.batch_jacobian_tensor((feature_maps, *group_batch[1:]))
+            grads = self._batch_gradients_from_inputs(group_batch)
         else:
             grads = tf.reshape(group_batch[0], (-1, self.model.nb_params))
 
-        # Compute the HVP for each pair features map - label
-        def single_hvp(single_grad):
-            hvp = self.hessian_vector_product(tf.expand_dims(single_grad, axis=-1))
-            return hvp
-
-        hvp_list = tf.map_fn(fn=single_hvp, elems=grads)
-
-        hvp_list = tf.transpose(hvp_list) if hvp_list.shape[-1] != 1 else tf.transpose(tf.squeeze(hvp_list, axis=-1))
+        # One matrix-valued operator application computes the HVP of every point while
+        # sharing the sweep over the training set between them
+        hvp = self.hessian_vector_product(tf.transpose(grads))
 
-        return hvp_list
+        return hvp
 
 
 class ConjugateGradientDescentIHVP(IterativeIHVP):
@@ -656,6 +894,20 @@ class ConjugateGradientDescentIHVP(IterativeIHVP):
     feature_extractor
         If the feature extraction model is not Sequential, the full TF graph must be provided for the computation of
         the different feature maps.
+    use_finite_diff_hvp
+        A boolean indicating whether the hessian-vector products inside the CGD iterations
+        should be approximated through finite differences of the gradient instead of
+        forward-over-backward AD. Useful when the forward accumulator is slow or unsupported
+        for some of the model's layers.
+    warm_start
+        A boolean indicating whether each solve should start from the previous solve's
+        solution instead of from zero. Consecutive solves share the hessian and often have
+        nearby right-hand sides, so CG then converges in fewer iterations. Only engages for
+        eager solves of same-shaped systems; it is a no-op inside traced pipelines.
+    hessian_subsample_frac
+        A float in (0, 1] with the fraction of the training points to sample (anew on each
+        CG iteration) for estimating the hessian, in the spirit of sub-sampled Newton
+        methods. The default of 1. uses the whole set.
     """
     def __init__(
             self,
@@ -664,10 +916,25 @@ class ConjugateGradientDescentIHVP(IterativeIHVP):
             train_dataset: tf.data.Dataset,
             n_opt_iters: Optional[int] = 100,
             feature_extractor: Optional[Model] = None,
+            use_finite_diff_hvp: bool = False,
+            warm_start: bool = False,
+            hessian_subsample_frac: float = 1.,
     ):
+        self.warm_start = warm_start
+        self._last_solution = None
+
         def iterative_function(operator, v, maxiter):  # pylint: disable=W0613
-            return conjugate_gradients_solve(operator, v, x0=None, maxiter=self.n_opt_iters)
-        super().__init__(iterative_function, model, extractor_layer, train_dataset, n_opt_iters, feature_extractor)
+            x0 = None
+            if self.warm_start and tf.executing_eagerly() and self._last_solution is not None \
+                    and self._last_solution.shape == v.shape:
+                x0 = self._last_solution
+            solution = conjugate_gradients_solve(operator, v, x0=x0, maxiter=self.n_opt_iters)
+            # Symbolic tensors must not leak out of a trace, hence the eager-only caching
+            if self.warm_start and tf.executing_eagerly():
+                self._last_solution = solution
+            return solution
+        super().__init__(iterative_function, model, extractor_layer, train_dataset, n_opt_iters, feature_extractor,
+                         use_finite_diff_hvp=use_finite_diff_hvp, hessian_subsample_frac=hessian_subsample_frac)
 
 
 class LissaIHVP(IterativeIHVP):
@@ -112,7 +112,7 @@ class BaseInfluenceModel:
         return self.model.layers
 
     @staticmethod
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _loss(
         model: tf.keras.Model,
         loss_function: Callable,
@@ -143,7 +143,7 @@ class BaseInfluenceModel:
         return loss_function(y_true, model(model_inp), sample_weight)
 
     @staticmethod
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _jacobian(model: tf.keras.Model, weights: tf.Tensor, loss_function: Callable,
                   batch: Tuple[tf.Tensor, ...], process_batch_for_loss_fn: ProcessBatchTypeAlias) -> tf.Tensor:
         """
@@ -167,20 +167,31 @@ class BaseInfluenceModel:
             The jacobian matrix for the set of inputs.
         """
         model_inp, y_true, sample_weight = process_batch_for_loss_fn(batch)
-        batch_size = tf.shape(y_true)[0]
-        with tf.GradientTape(watch_accessed_variables=False) as tape:
-            tape.watch(weights)
-            y_pred = loss_function(y_true, model(model_inp), sample_weight)
-
-        jacobian = tape.jacobian(y_pred, weights)
 
-        jacobian = [tf.reshape(j, (batch_size, -1,)) for j in jacobian]
-        jacobian = tf.concat(jacobian, axis=1)
+        def single_gradient(elt):
+            with tf.GradientTape(watch_accessed_variables=False) as tape:
+                tape.watch(weights)
+                if sample_weight is None:
+                    inp, y_t = elt
+                    loss = loss_function(tf.expand_dims(y_t, axis=0), model(tf.expand_dims(inp, axis=0)))
+                else:
+                    inp, y_t, s_w = elt
+                    loss = loss_function(tf.expand_dims(y_t, axis=0), model(tf.expand_dims(inp, axis=0)),
+                                         tf.expand_dims(s_w, axis=0))
+                loss = tf.reduce_sum(loss)
+            gradients = tape.gradient(loss, weights)
+            return tf.concat([tf.reshape(g, (-1,)) for g in gradients], axis=0)
+
+        # pfor vectorizes the per-example backward passes into a single batched graph,
+        # without building the [batch, batch]-structured graph that tape.jacobian implies.
+        # Ops that pfor cannot convert degrade gracefully to a while_loop instead of failing
+        elems = (model_inp, y_true) if sample_weight is None else (model_inp, y_true, sample_weight)
+        jacobian = tf.vectorized_map(single_gradient, elems, fallback_to_while_loop=True)
 
         return jacobian
 
     @staticmethod
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _gradient(model: tf.keras.Model, weights: tf.Variable, loss_function: Callable,
                   batch: Tuple[tf.Tensor, ...], process_batch_for_loss_fn: ProcessBatchTypeAlias) -> tf.Tensor:
         """
@@ -256,7 +267,7 @@ class BaseInfluenceModel:
 
         return loss_values
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def batch_jacobian_tensor(self, batch: Tuple[tf.Tensor, ...]) -> tf.Tensor:
         """
         Computes the jacobian of the loss wrt the weights of the start_layer on a Tensor
@@ -303,7 +314,7 @@ class BaseInfluenceModel:
 
         return jacobians
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def batch_gradient_tensor(self, batch: Tuple[tf.Tensor, ...]) -> tf.Tensor:
         """
         Computes the gradient of the loss wrt the weights of the start_layer on a Tensor
@@ -275,7 +275,7 @@ class ArnoldiInfluenceCalculator(BaseInfluenceCalculator):
         influence_values
             A tensor with the influence scores
         """
-        influence_values = tf.matmul(preproc_test_sample, tf.transpose(influence_vector))
+        influence_values = tf.matmul(preproc_test_sample, influence_vector, transpose_b=True)
         influence_values = tf.math.real(influence_values)
 
         return influence_values
@@ -22,8 +22,8 @@ from ..common import InfluenceModel
 from ..common import BaseInfluenceCalculator
 from ..common import InverseHessianVectorProduct, IHVPCalculator
 
-from ..types import Optional, Union, Tuple
-from ..utils import assert_batched_dataset
+from ..types import Optional, Sequence, Union, Tuple
+from ..utils import assert_batched_dataset, blocked_matmul
 
 
 class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceCalculator):
@@ -67,6 +67,11 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
         Implement "RelatIF: Identifying Explanatory Training Examples via Relative Influence"
         https://arxiv.org/pdf/2003.11630.pdf
         if True, compute the relative influence by normalizing the influence function.
+    matmul_block_size
+        An optional integer with the tile size (in number of parameters) for the influence
+        score matmuls. When set, the scores are accumulated over blocks of the parameter
+        dimension, bounding the peak memory of the computation for very large models.
+        If None (default), a single full matmul is performed.
     """
 
     def __init__(
@@ -76,7 +81,8 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
             ihvp_calculator: Union[str, InverseHessianVectorProduct, IHVPCalculator] = 'exact',
             n_samples_for_hessian: Optional[int] = None,
             shuffle_buffer_size: Optional[int] = 10000,
-            normalize=False
+            normalize=False,
+            matmul_block_size: Optional[int] = None
     ):
         super().__init__(
             model,
@@ -87,8 +93,9 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
         )
 
         self.normalize = normalize
+        self.matmul_block_size = matmul_block_size
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _normalize_if_needed(self, v):
         """
         Normalize the input vector if the normalize property is True. If False, do nothing
@@ -104,10 +111,12 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
             The normalized vector if the normalize property is True, otherwise the input vector
         """
         if self.normalize:
-            v = v / tf.norm(v, axis=0, keepdims=True)
+            # multiply by the reciprocal square-root: square + reduce + rsqrt + multiply all
+            # fuse element-wise, avoiding the separate norm kernel and the division
+            v = v * tf.math.rsqrt(tf.reduce_sum(tf.square(v), axis=0, keepdims=True))
         return v
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _compute_influence_vector(self, train_samples: Tuple[tf.Tensor, ...]) -> tf.Tensor:
         """
         Computes the influence vector (i.e. the delta of model's weights after a perturbation on the training
@@ -128,7 +137,7 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
         influence_vector = tf.transpose(influence_vector)
         return influence_vector
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _preprocess_samples(self, samples: Tuple[tf.Tensor, ...]) -> tf.Tensor:
         """
         Preprocess a sample to evaluate
@@ -171,7 +180,7 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
             self._compute_influence_vector(train_samples)
         )
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _estimate_influence_value_from_influence_vector(self, preproc_test_sample: tf.Tensor,
                                                         influence_vector: tf.Tensor) -> tf.Tensor:
         """
@@ -190,10 +199,13 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
         influence_values
             A tensor with the resulting influence value.
         """
-        influence_values = tf.matmul(preproc_test_sample, tf.transpose(influence_vector))
+        if self.matmul_block_size is not None:
+            influence_values = blocked_matmul(preproc_test_sample, influence_vector, self.matmul_block_size)
+        else:
+            influence_values = tf.matmul(preproc_test_sample, influence_vector, transpose_b=True)
         return influence_values
 
-    @tf.function
+    @tf.function(experimental_relax_shapes=True)
     def _compute_influence_value_from_batch(self, train_samples: Tuple[tf.Tensor, ...]) -> tf.Tensor:
         """
         Computes the influence score (self-influence) for a single batch of training samples.
@@ -208,11 +220,17 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
         influence_values
             The influence score of each sample in the batch train_samples.
         """
-        batched_inf_vect = self._compute_influence_vector(train_samples)
+        # Compute the gradients once and feed them to the IHVP directly, so that the same
+        # jacobian is not recomputed a second time inside the IHVP calculator
         evaluate_vect = self._preprocess_samples(train_samples)
-        influence_values = tf.reduce_sum(
-            tf.math.multiply(evaluate_vect, batched_inf_vect), axis=1, keepdims=True)
-        #TODO: improve IHVP to not compute 2 times the gradient
+        batched_inf_vect = self.ihvp_calculator._compute_ihvp_single_batch(  # pylint: disable=W0212
+            (evaluate_vect,), use_gradient=False)
+        batched_inf_vect = self._normalize_if_needed(batched_inf_vect)
+        # einsum fuses the element-wise product and the row-wise reduction into a single
+        # kernel, and pairs the [B, F] gradients with the solvers' canonical [F, B] layout
+        # directly, without materializing a transposed copy first
+        influence_values = tf.expand_dims(
+            tf.einsum('bf,fb->b', evaluate_vect, batched_inf_vect), axis=-1)
         return influence_values
 
     def compute_influence_vector_group(
@@ -236,9 +254,11 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
         """
         assert_batched_dataset(group)
 
-        ihvp_ds = self.ihvp_calculator.compute_ihvp(group)
-        reduced_ihvp = ihvp_ds.map(lambda x: tf.reduce_sum(x, axis=1, keepdims=True))
-        reduced_ihvp = reduced_ihvp.reduce(tf.constant(0, dtype=ihvp_ds.element_spec.dtype), lambda x, y: x + y)
+        # The IHVP is linear in its right-hand side, so summing the gradients of the group
+        # and solving once is equivalent to solving per point and summing afterwards
+        reduced_grads = tf.reduce_sum(self.model.batch_gradient(group), axis=0, keepdims=True)
+        reduced_ihvp = self.ihvp_calculator._compute_ihvp_single_batch(  # pylint: disable=W0212
+            (reduced_grads,), use_gradient=False)
 
         reduced_ihvp = self._normalize_if_needed(reduced_ihvp)
 
@@ -280,17 +300,77 @@ class FirstOrderInfluenceCalculator(BaseInfluenceCalculator, BaseGroupInfluenceC
             # default to self influence
             group_to_evaluate = group_train
 
-        ds_size = self.assert_compatible_datasets(group_train, group_to_evaluate)
+        self.assert_compatible_datasets(group_train, group_to_evaluate)
 
-        reduced_grads = tf.reduce_sum(tf.reshape(self.model.batch_jacobian(group_to_evaluate),
-                                                 (ds_size, -1)), axis=0, keepdims=True)
+        # The sum of the per-sample jacobians is the gradient of the summed loss (a VJP against
+        # a ones-vector), so there is no need to materialize the [ds_size, nb_params] jacobian
+        reduced_grads = tf.reduce_sum(self.model.batch_gradient(group_to_evaluate), axis=0, keepdims=True)
 
-        ihvp_ds = self.ihvp_calculator.compute_ihvp(group_train)
-        reduced_ihvp = ihvp_ds.map(lambda x: tf.reduce_sum(x, axis=1, keepdims=True))
-        reduced_ihvp = reduced_ihvp.reduce(tf.constant(0, dtype=ihvp_ds.element_spec.dtype), lambda x, y: x + y)
+        # Same linearity argument as in compute_influence_vector_group: one solve on the
+        # summed gradient of the training group instead of one per point
+        reduced_train_grads = tf.reduce_sum(self.model.batch_gradient(group_train), axis=0, keepdims=True)
+        reduced_ihvp = self.ihvp_calculator._compute_ihvp_single_batch(  # pylint: disable=W0212
+            (reduced_train_grads,), use_gradient=False)
 
         reduced_ihvp = self._normalize_if_needed(reduced_ihvp)
 
         influence_values_group = tf.matmul(reduced_grads, reduced_ihvp)
 
         return influence_values_group
+
+    def estimate_influence_values_groups(
+            self,
+            groups_train: Sequence[tf.data.Dataset],
+            groups_to_evaluate: Optional[Sequence[tf.data.Dataset]] = None
+    ) -> tf.Tensor:
+        """
+        Computes Cook's distance of several groups of points at once, stacking the summed
+        gradients of all the groups so that the IHVP is solved with a single multi-RHS call
+        and the influence values come out of one matmul, instead of repeating the whole
+        pipeline once per group.
+
+        As in estimate_influence_values_group, each training group is paired with the
+        evaluation group at the same position, and both must contain the same amount of
+        points. If no evaluation groups are provided, the self-influence of each training
+        group is computed.
+
+        Parameters
+        ----------
+        groups_train
+            A sequence of batched TF datasets, each containing a group of points we wish to remove.
+        groups_to_evaluate
+            An optional sequence of batched TF datasets, each containing the group of points with
+            respect to whom we wish to measure the influence of removing the training points.
+
+        Returns
+        -------
+        influence_values_groups
+            A tensor with one influence value per group, of shape (nb_groups, 1).
+        """
+        if groups_to_evaluate is None:
+            # default to self influence
+            groups_to_evaluate = groups_train
+
+        if len(groups_train) != len(groups_to_evaluate):
+            raise ValueError("The amount of training and evaluation groups must match.")
+
+        for group_train, group_to_evaluate in zip(groups_train, groups_to_evaluate):
+            self.assert_compatible_datasets(group_train, group_to_evaluate)
+
+        reduced_grads = tf.concat([
+            tf.reduce_sum(self.model.batch_gradient(group), axis=0, keepdims=True)
+            for group in groups_to_evaluate
+        ], axis=0)
+
+        reduced_train_grads = tf.concat([
+            tf.reduce_sum(self.model.batch_gradient(group), axis=0, keepdims=True)
+            for group in groups_train
+        ], axis=0)
+        reduced_ihvp = self.ihvp_calculator._compute_ihvp_single_batch(  # pylint: disable=W0212
+            (reduced_train_grads,), use_gradient=False)
+
+        reduced_ihvp = self._normalize_if_needed(reduced_ihvp)
+
+        influence_values_groups = tf.reduce_sum(reduced_grads * tf.transpose(reduced_ihvp), axis=1, keepdims=True)
+
+        return influence_values_groups
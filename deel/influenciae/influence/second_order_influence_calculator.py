@@ -163,19 +163,20 @@ class SecondOrderInfluenceCalculator(BaseGroupInfluenceCalculator):
         ihvp_ds = ihvp_ds.map(lambda x: tf.reduce_sum(x, axis=1))
 
         reduced_ihvp = ihvp_ds.reduce(tf.constant(0, dtype=ihvp_ds.element_spec.dtype), lambda x, y: x + y)
-        reduced_ihvp_ds = tf.data.Dataset.from_tensors(reduced_ihvp).batch(dataset._batch_size)  # pylint: disable=W0212
 
-        local_hvp = local_ihvp.compute_hvp(reduced_ihvp_ds, use_gradient=False).batch(
-            dataset._batch_size)  # pylint: disable=W0212
+        # Chain the remaining (I)HVPs directly on the tensors: re-wrapping these single vectors
+        # inside a tf.data.Dataset at each call would only add graph-construction and iterator
+        # overhead without bringing any batching benefit.
+        local_hvp = local_ihvp._compute_hvp_single_batch(  # pylint: disable=W0212
+            (tf.reshape(reduced_ihvp, (1, -1)),), use_gradient=False)
 
-        interactions = self.ihvp_calculator.compute_ihvp(
-            local_hvp, use_gradient=False
-        )
+        interactions = self.ihvp_calculator._compute_ihvp_single_batch(  # pylint: disable=W0212
+            (tf.transpose(local_hvp),), use_gradient=False)
 
-        ds_size = tf.cast(dataset_size(dataset), dtype=interactions.element_spec.dtype)
-        interactions = interactions.map(lambda x: x * ds_size)
+        ds_size = tf.cast(dataset_size(dataset), dtype=interactions.dtype)
+        interactions = interactions * ds_size
 
-        return interactions.get_single_element()
+        return interactions
 
     def estimate_influence_values_group(
             self,
@@ -309,7 +309,7 @@ class RepresenterPointL2(BaseInfluenceCalculator):
             tape.watch(self.linear_layer.weights)
             logits = self.linear_layer(z_batch)
             loss = self.linear_layer.compiled_loss(y_batch, logits)
-        alpha = tape.jacobian(loss, self.linear_layer.weights)[0]
+        alpha = tape.jacobian(loss, self.linear_layer.weights, experimental_use_pfor=True)[0]
         alpha = tf.divide(
             alpha,
             -2. * self.lambda_regularization * tf.cast(self.n_train, alpha.dtype) + tf.constant(1e-5, dtype=alpha.dtype)
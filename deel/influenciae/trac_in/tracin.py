@@ -136,7 +136,7 @@ class TracIn(BaseInfluenceCalculator):
         influence_values
             A tensor with the influence scores
         """
-        influence_values = tf.matmul(preproc_test_sample, tf.transpose(influence_vector))
+        influence_values = tf.matmul(preproc_test_sample, influence_vector, transpose_b=True)
         return influence_values
 
     def _compute_influence_value_from_batch(self, train_samples: Tuple[tf.Tensor, ...]) -> tf.Tensor:
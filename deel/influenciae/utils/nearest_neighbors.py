@@ -78,6 +78,14 @@ class LinearNearestNeighbors(BaseNearestNeighbors):
     An implementation of a Linear Nearest Neighbors search algorithm using a given similarity metric and
     doing as much lazy computations as possible for scalability.
 
+    Parameters
+    ----------
+    compute_dtype
+        An optional reduced-precision data-type (e.g. tf.bfloat16) in which to carry out the
+        dot products of the search. The scores are cast back to the search's data-type before
+        being accumulated, so only the (bandwidth-bound) scoring itself runs at reduced
+        precision. If None, the dot products are computed in the tensors' native precision.
+
     Attributes
     ----------
     dataset
@@ -89,10 +97,13 @@ class LinearNearestNeighbors(BaseNearestNeighbors):
         the batch.
     """
 
-    def __init__(self):
+    def __init__(self, compute_dtype: Optional[tf.DType] = None):
+        self.compute_dtype = compute_dtype
         self.dataset = None
         self.dot_product_fun = None
         self.batched_sorted_dict = None
+        self.scoring_fun = None
+        self.d_type = None
 
     def build(
         self,
@@ -124,10 +135,14 @@ class LinearNearestNeighbors(BaseNearestNeighbors):
         """
         self.dataset = dataset
         self.dot_product_fun = dot_product_fun
+        # Compile the per-batch scoring into a single XLA kernel so that the dot product and
+        # the reductions get fused, instead of being dispatched op-by-op for each batch.
+        self.scoring_fun = tf.function(dot_product_fun, jit_compile=True, experimental_relax_shapes=True)
+        self.d_type = d_type
         batch_shape = self.dataset.element_spec[0][0].shape[1:]
         self.batched_sorted_dict = BatchSort(batch_shape, [query_batch_size, k], dtype=d_type, order=order)
 
-    def query(self, vector_to_find: tf.Tensor, batch_size: Optional[int] = None) -> Tuple[tf.Tensor, tf.Tensor]:
+    def query(self, vector_to_find: tf.Tensor, batch_size: Optional[int] = None) -> Tuple[tf.Tensor, tf.Tensor]:  # pylint: disable=W0613
         """
         Find the k closest points to the provided vector in the object's dataset.
 
@@ -144,20 +159,22 @@ class LinearNearestNeighbors(BaseNearestNeighbors):
             A tuple with the k closest points to the queries and their corresponding distances in the format
             (distances, points)
         """
-        if batch_size is None:
-            batch_size = tf.shape(vector_to_find)[0]
-
         dataset_iterator = iter(self.dataset)
         self.batched_sorted_dict.reset()
 
         def body_func(i):
             batch, ihvp = next(dataset_iterator)
-            influence_values = self.dot_product_fun(vector_to_find, ihvp)
-
-            self.batched_sorted_dict.add_all(
-                tf.repeat(tf.expand_dims(batch[0], axis=0), batch_size, axis=0),
-                influence_values
-            )
+            if self.compute_dtype is not None:
+                influence_values = tf.cast(
+                    self.scoring_fun(tf.cast(vector_to_find, self.compute_dtype),
+                                     tf.cast(ihvp, self.compute_dtype)),
+                    self.d_type
+                )
+            else:
+                influence_values = self.scoring_fun(vector_to_find, ihvp)
+
+            # The training batch is the same for every query: no need to tile it
+            self.batched_sorted_dict.add_all_shared(batch[0], influence_values)
 
             return (i+1, )
 
@@ -49,6 +49,28 @@ class BatchSort:
         else:
             self.best_values = tf.Variable(tf.ones(k_shape, dtype=dtype) * np.inf, trainable=False)
 
+    def _top_k_scores(self, current_score: tf.Tensor) -> tf.Tensor:
+        """
+        Selects the k best scores (and their positions) out of the merged score tensor.
+        tf.math.top_k only keeps a running set of k candidates instead of fully sorting
+        the merged scores, which keeps the per-batch merge O(n log k) and memory-bounded.
+
+        Parameters
+        ----------
+        current_score
+            A tensor with the merged scores, of shape [batch, k + new_elements].
+
+        Returns
+        -------
+        scores, indexes
+            The k best (sorted) scores and their indexes in the merged tensor.
+        """
+        if self.order == ORDER.DESCENDING:
+            return tf.math.top_k(current_score, k=self.k, sorted=True)
+
+        scores, indexes = tf.math.top_k(-current_score, k=self.k, sorted=True)
+        return -scores, indexes
+
     def add_all(self, batch_key: tf.Tensor, batch_values: tf.Tensor) -> None:
         """
         Add a new batch of data (element and values) and update the sorted dictionary retaining only the
@@ -64,15 +86,39 @@ class BatchSort:
         current_score = tf.concat([self.best_values, batch_values], axis=1)
         current_batch = tf.concat([self.best_batch, batch_key], axis=1)
 
-        if self.order == ORDER.DESCENDING:
-            indexes = tf.argsort(current_score, axis=1, direction='DESCENDING')
-        else:
-            indexes = tf.argsort(current_score, axis=1, direction='ASCENDING')
+        current_best_score, indexes = self._top_k_scores(current_score)
+        current_best_samples = tf.gather(current_batch, indexes, batch_dims=1)
 
-        indexes = indexes[:, :self.k]
+        self.best_values.assign(current_best_score)
+        self.best_batch.assign(current_best_samples)
 
-        current_best_score = tf.gather(current_score, indexes, batch_dims=1)
-        current_best_samples = tf.gather(current_batch, indexes, batch_dims=1)
+    def add_all_shared(self, batch_key: tf.Tensor, batch_values: tf.Tensor) -> None:
+        """
+        Add a new batch of data and update the sorted dictionary retaining only the
+        top/bottom-k elements, for the case where all the rows of values refer to the same
+        batch of elements. Compared to add_all, this avoids tiling the elements once per
+        row of values: only the (at most k) retained elements are gathered per row.
+
+        Parameters
+        ----------
+        batch_key
+            A batch of new elements in the form of a tensor, shared by all the rows of values.
+        batch_values
+            A batch of their corresponding values in the form of a tensor, with one row per
+            entry of the sorted dictionary.
+        """
+        current_score = tf.concat([self.best_values, batch_values], axis=1)
+
+        current_best_score, indexes = self._top_k_scores(current_score)
+
+        # Indexes below k point into the current best elements, the rest into the shared batch
+        from_best = tf.gather(self.best_batch, tf.minimum(indexes, self.k - 1), batch_dims=1)
+        from_batch = tf.gather(batch_key, tf.maximum(indexes - self.k, 0))
+        picks_best = tf.reshape(
+            indexes < self.k,
+            tf.concat([tf.shape(indexes), tf.ones(tf.rank(from_best) - 2, dtype=tf.int32)], axis=0)
+        )
+        current_best_samples = tf.where(picks_best, from_best, from_batch)
 
         self.best_values.assign(current_best_score)
         self.best_batch.assign(current_best_samples)
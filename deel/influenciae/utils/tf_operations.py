@@ -219,6 +219,56 @@ def array_to_dataset(
     return dataset
 
 
+def blocked_matmul(matrix_a: tf.Tensor, matrix_b: tf.Tensor, block_size: int) -> tf.Tensor:
+    """
+    Computes matmul(matrix_a, transpose(matrix_b)) by accumulating partial products over
+    tiles of the shared inner dimension. The result is identical (same FLOPs), but at no
+    point does the computation require both full operands to be resident alongside the
+    matmul's workspace, which matters when the inner dimension is the number of model
+    parameters.
+
+    Parameters
+    ----------
+    matrix_a
+        A tensor of shape [n, nb_features].
+    matrix_b
+        A tensor of shape [m, nb_features].
+    block_size
+        An integer with the amount of columns of the inner dimension to process per tile.
+
+    Returns
+    -------
+    product
+        A tensor of shape [n, m] equal to matmul(matrix_a, transpose(matrix_b)).
+    """
+    nb_features = matrix_a.shape[-1]
+    size_splits = [block_size] * (nb_features // block_size)
+    if nb_features % block_size != 0:
+        size_splits.append(nb_features % block_size)
+
+    product = tf.zeros((tf.shape(matrix_a)[0], tf.shape(matrix_b)[0]), dtype=matrix_a.dtype)
+    for tile_a, tile_b in zip(tf.split(matrix_a, size_splits, axis=-1),
+                              tf.split(matrix_b, size_splits, axis=-1)):
+        product += tf.matmul(tile_a, tile_b, transpose_b=True)
+
+    return product
+
+
+def enable_xla_autoclustering() -> None:
+    """
+    Enables XLA just-in-time compilation through auto-clustering for the whole TF runtime.
+    XLA will automatically group compatible operations (e.g. the matmuls and reductions of
+    the influence computations) into fused kernels, which can considerably speed up the
+    calculations at the cost of an initial compilation overhead.
+
+    Notes
+    -----
+    This is a global, opt-in setting: it affects every graph that is traced after the call,
+    not only the ones belonging to this library.
+    """
+    tf.config.optimizer.set_jit("autoclustering")
+
+
 def get_device(device: Optional[str]) -> str:
     """
     Gets the name of the device to use. If there are any available GPUs, it will use the first one
@@ -157,6 +157,24 @@ def test_exact_hessian():
     assert almost_equal(inv_hessian, ground_truth_inv_hessian, epsilon=1e-3)
 
 
+def test_exact_gauss_newton_hessian():
+    # The Gauss-Newton approximation should match the mean outer product of the gradients
+    model = Sequential([Input(shape=(1, 3)), Dense(2, use_bias=False), Dense(1, use_bias=False)])
+    model.build(input_shape=(1, 3))
+    influence_model = InfluenceModel(model, start_layer=-1, loss_function=MeanSquaredError(reduction=Reduction.NONE))
+    kernel = tf.reshape(tf.concat([tf.reshape(layer.weights[0], -1) for layer in influence_model.layers], axis=0), -1)
+    inputs = tf.random.normal((25, 1, 3))
+    target = tf.random.normal((25, 1))
+    train_set = tf.data.Dataset.from_tensor_slices((inputs, target))
+
+    ihvp_calculator = ExactIHVP(influence_model, train_set.batch(5), use_gauss_newton=True)
+    assert ihvp_calculator.hessian.shape == (2, 2)
+
+    ground_truth_grads = tf.concat([jacobian_ground_truth(inp[0], kernel, y) for inp, y in zip(inputs, target)], axis=1)
+    ground_truth_gauss_newton = tf.matmul(ground_truth_grads, ground_truth_grads, transpose_b=True) / 25.
+    assert almost_equal(ihvp_calculator.hessian, ground_truth_gauss_newton, epsilon=1e-3)
+
+
 def test_exact_ihvp():
     # Make sure that the shapes are right and that the exact ihvp calculation is correct
     model = Sequential([Input(shape=(1, 3)), Dense(2, use_bias=False), Dense(1, use_bias=False)])
@@ -214,6 +232,51 @@ def test_exact_ihvp():
     assert almost_equal(ihvp_vectors, ground_truth_ihvp_vector, epsilon=1e-3)
 
 
+def test_exact_ihvp_singular_hessian():
+    # The truncated-eigendecomposition fallback should match the Moore-Penrose pseudo-inverse
+    model = Sequential([Input(shape=(1, 3)), Dense(2, use_bias=False), Dense(1, use_bias=False)])
+    model.build(input_shape=(1, 3))
+    influence_model = InfluenceModel(model, start_layer=-1, loss_function=MeanSquaredError(reduction=Reduction.NONE))
+
+    singular_hessian = tf.constant([[2., 0.], [0., 0.]])
+    ihvp_calculator = ExactIHVP(influence_model, train_hessian=singular_hessian)
+    assert ihvp_calculator._cholesky is None  # pylint: disable=W0212
+    assert almost_equal(ihvp_calculator.inv_hessian, tf.linalg.pinv(singular_hessian), epsilon=1e-6)
+
+    indefinite_hessian = tf.constant([[1., 2.], [2., -3.]])
+    ihvp_calculator = ExactIHVP(influence_model, train_hessian=indefinite_hessian)
+    assert almost_equal(ihvp_calculator.inv_hessian, tf.linalg.pinv(indefinite_hessian), epsilon=1e-5)
+
+
+def test_exact_ihvp_reduced_precision():
+    # The reduced-precision hessian should reproduce the full-precision IHVPs up to bf16 resolution
+    model = Sequential([Input(shape=(1, 3)), Dense(2, use_bias=False), Dense(1, use_bias=False)])
+    model.build(input_shape=(1, 3))
+    influence_model = InfluenceModel(model, start_layer=-1, loss_function=MeanSquaredError(reduction=Reduction.NONE))
+    inputs = tf.random.normal((25, 1, 3))
+    target = tf.random.normal((25, 1))
+    train_set = tf.data.Dataset.from_tensor_slices((inputs, target))
+
+    # A little damping keeps the system well-conditioned so the comparison measures the
+    # precision loss of the bf16 storage rather than the conditioning of the random draw
+    ihvp_calculator = ExactIHVP(influence_model, train_set.batch(5), damping=1.)
+    ihvp_calculator_bf16 = ExactIHVP(influence_model, train_set.batch(5), damping=1., hessian_dtype=tf.bfloat16)
+    assert ihvp_calculator_bf16.inv_hessian.dtype == tf.bfloat16
+    assert ihvp_calculator_bf16.hessian.dtype == tf.bfloat16
+
+    ihvp = tf.concat(list(ihvp_calculator.compute_ihvp(train_set.batch(5))), axis=1)
+    ihvp_bf16 = tf.concat(list(ihvp_calculator_bf16.compute_ihvp(train_set.batch(5))), axis=1)
+    assert ihvp_bf16.dtype == ihvp.dtype  # the API still speaks the gradients' dtype
+    scale = tf.reduce_max(tf.abs(ihvp))
+    assert almost_equal(ihvp / scale, ihvp_bf16 / scale, epsilon=5e-2)
+
+    hvp = tf.concat(list(ihvp_calculator.compute_hvp(train_set.batch(5))), axis=1)
+    hvp_bf16 = tf.concat(list(ihvp_calculator_bf16.compute_hvp(train_set.batch(5))), axis=1)
+    assert hvp_bf16.dtype == hvp.dtype
+    scale = tf.reduce_max(tf.abs(hvp))
+    assert almost_equal(hvp / scale, hvp_bf16 / scale, epsilon=5e-2)
+
+
 def test_exact_hvp():
     # Make sure that the shapes are right and that the exact hvp calculation is correct
     # Make sure that the hessian matrix is being calculated right
@@ -363,6 +426,88 @@ def test_cgd_ihvp():
     assert almost_equal(ihvp_vectors, ground_truth_ihvp_vector, epsilon=1e-3)
 
 
+def test_cgd_finite_diff_hvp():
+    # Make sure that the finite-difference approximation of the HVP matches the symbolic hessian
+    model = Sequential([Input(shape=(1, 3)), Dense(2, use_bias=False), Dense(1, use_bias=False)])
+    model.build(input_shape=(1, 3))
+    influence_model = InfluenceModel(model, start_layer=-1, loss_function=MeanSquaredError(reduction=Reduction.NONE))
+    kernel = tf.reshape(tf.concat([tf.reshape(layer.weights[0], -1) for layer in influence_model.layers], axis=0), -1)
+    inputs = tf.random.normal((25, 1, 3))
+    target = tf.random.normal((25, 1))
+    train_set = tf.data.Dataset.from_tensor_slices((inputs, target))
+
+    # Compute the HVP through finite differences and check shapes
+    ihvp_calculator = ConjugateGradientDescentIHVP(influence_model, extractor_layer=1,
+                                                   train_dataset=train_set.batch(5), use_finite_diff_hvp=True)
+    hvp = ihvp_calculator.compute_hvp(train_set.batch(5))
+    hvp_list = []
+    for elt in hvp:
+        assert elt.shape == (2, 5)  # nb_params times batch_size stacked on the last axis
+        hvp_list.append(elt)
+    hvp = tf.concat(hvp_list, axis=1)
+    assert hvp.shape == (2, 25)  # nb_params times nb_elt stacked on the last axis
+
+    # Compute the HVP symbolically and check results with a tolerance fitting the
+    # truncation plus fp32 round-off error of the central differences
+    hessian_list = tf.concat([
+        tf.expand_dims(hessian_ground_truth(tf.squeeze(inp), kernel), axis=0) for inp in inputs
+    ], axis=0)
+    ground_truth_hessian = tf.reduce_mean(hessian_list, axis=0)
+    ground_truth_grads = tf.concat([jacobian_ground_truth(inp[0], kernel, y) for inp, y in zip(inputs, target)], axis=1)
+    ground_truth_hvp = tf.matmul(ground_truth_hessian, ground_truth_grads)
+    assert almost_equal(hvp, ground_truth_hvp, epsilon=1e-1)
+
+
+def test_cgd_warm_start():
+    # Warm-started solves should cache the last solution and still agree with cold starts
+    model = Sequential([Input(shape=(1, 3)), Dense(2, use_bias=False), Dense(1, use_bias=False)])
+    model.build(input_shape=(1, 3))
+    influence_model = InfluenceModel(model, start_layer=-1, loss_function=MeanSquaredError(reduction=Reduction.NONE))
+    inputs = tf.random.normal((25, 1, 3))
+    target = tf.random.normal((25, 1))
+    train_set = tf.data.Dataset.from_tensor_slices((inputs, target))
+    batch = next(iter(train_set.batch(5)))
+
+    cold_calculator = ConjugateGradientDescentIHVP(influence_model, extractor_layer=-1,
+                                                   train_dataset=train_set.batch(5))
+    warm_calculator = ConjugateGradientDescentIHVP(influence_model, extractor_layer=-1,
+                                                   train_dataset=train_set.batch(5), warm_start=True)
+
+    ihvp_cold = cold_calculator._compute_ihvp_single_batch(batch)  # pylint: disable=W0212
+    ihvp_warm = warm_calculator._compute_ihvp_single_batch(batch)  # pylint: disable=W0212
+    assert warm_calculator._last_solution is not None  # pylint: disable=W0212
+    assert almost_equal(ihvp_cold, ihvp_warm, epsilon=1e-4)
+
+    # Starting from the cached exact solution, the solve should reproduce it
+    ihvp_restarted = warm_calculator._compute_ihvp_single_batch(batch)  # pylint: disable=W0212
+    assert almost_equal(ihvp_warm, ihvp_restarted, epsilon=1e-4)
+
+
+def test_cgd_hessian_subsample():
+    # The subsampled operator should keep shapes and dtypes and stay in the right ballpark
+    model = Sequential([Input(shape=(1, 3)), Dense(2, use_bias=False), Dense(1, use_bias=False)])
+    model.build(input_shape=(1, 3))
+    influence_model = InfluenceModel(model, start_layer=-1, loss_function=MeanSquaredError(reduction=Reduction.NONE))
+    inputs = tf.random.normal((100, 1, 3))
+    target = tf.random.normal((100, 1))
+    train_set = tf.data.Dataset.from_tensor_slices((inputs, target))
+
+    ihvp_calculator = ConjugateGradientDescentIHVP(influence_model, extractor_layer=-1,
+                                                   train_dataset=train_set.batch(25))
+    subsampled_calculator = ConjugateGradientDescentIHVP(influence_model, extractor_layer=-1,
+                                                         train_dataset=train_set.batch(25),
+                                                         hessian_subsample_frac=0.5)
+
+    batch = next(iter(train_set.batch(25)))
+    ihvp = ihvp_calculator._compute_ihvp_single_batch(batch)  # pylint: disable=W0212
+    ihvp_subsampled = subsampled_calculator._compute_ihvp_single_batch(batch)  # pylint: disable=W0212
+    assert ihvp_subsampled.shape == ihvp.shape
+    assert bool(tf.reduce_all(tf.math.is_finite(ihvp_subsampled)))
+    # Subsampled Newton solves stay close to the full solve on a well-conditioned system
+    scale = tf.reduce_max(tf.abs(ihvp))
+    assert float(tf.reduce_mean(tf.abs(ihvp - ihvp_subsampled) / scale)) < 0.1
+
+
 def test_lissa_ihvp():
     # Make sure that the shapes are right and that the exact ihvp calculation is correct
     # Make sure that the hessian matrix is being calculated right
@@ -375,6 +375,15 @@ def test_compute_top_k_from_training_dataset():
                 assert almost_equal(gt_top_k_influences_values, top_k_influences, epsilon=1e-3)
                 assert almost_equal(gt_top_k_samples, top_k_samples, epsilon=1e-3)
 
+    # datasets that cannot report their cardinality (e.g. after a filter) should give the same results
+    unknown_cardinality_set = train_set.filter(lambda *sample: True).batch(5)
+    assert unknown_cardinality_set.cardinality() == tf.data.UNKNOWN_CARDINALITY
+    top_k_samples_unknown, top_k_influences_unknown = influence_calculator.compute_top_k_from_training_dataset(
+        unknown_cardinality_set, k=5, order=order
+    )
+    assert almost_equal(top_k_influences_unknown, top_k_influences, epsilon=1e-6)
+    assert almost_equal(top_k_samples_unknown, top_k_samples, epsilon=1e-6)
+
 
 def test_compute_influence_values_dataset():
     """
@@ -945,6 +954,37 @@ def test_compute_influence_values_group():
         assert tf.reduce_max(tf.abs(influence - tf.transpose(ground_truth_influence_values_group))) < 1E-3
 
 
+def test_estimate_influence_values_groups():
+    """
+    Test that the stacked multi-group computation matches per-group calls
+    """
+    set_seed()
+    model = Sequential([Input(shape=(1, 3)), Dense(2, use_bias=False), Dense(1, use_bias=False)])
+    model.build(input_shape=(1, 3))
+
+    influence_model = InfluenceModel(model, start_layer=-1, loss_function=MeanSquaredError(reduction=Reduction.NONE))
+
+    inputs_train = tf.random.normal((25, 1, 3))
+    targets_train = tf.random.normal((25, 1))
+
+    train_set = tf.data.Dataset.from_tensor_slices((inputs_train, targets_train))
+    groups_train = [train_set.take(10).batch(10), train_set.skip(10).take(10).batch(10)]
+    groups_test = [train_set.skip(5).take(10).batch(10), train_set.skip(15).take(10).batch(10)]
+
+    influence_calculator = FirstOrderInfluenceCalculator(influence_model, train_set.batch(5),
+                                                         ExactIHVP(influence_model, train_set.batch(5)),
+                                                         n_samples_for_hessian=25,
+                                                         shuffle_buffer_size=25)
+
+    expected = tf.concat([
+        influence_calculator.estimate_influence_values_group(group_train, group_test)
+        for group_train, group_test in zip(groups_train, groups_test)
+    ], axis=0)
+    influence_values = influence_calculator.estimate_influence_values_groups(groups_train, groups_test)
+    assert influence_values.shape == (2, 1)
+    assert tf.reduce_max(tf.abs(influence_values - expected)) < 1E-4
+
+
 def test_cnn_shapes():
     """
     Test all methods with a more challenging model
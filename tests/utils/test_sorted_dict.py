@@ -79,6 +79,40 @@ def test_batched_sorted_dict_2():
     assert tf.reduce_max(tf.abs(k - values_expected)) < 1E-6
 
 
+def test_batched_sorted_dict_shared():
+    bsd = BatchSort(batch_shape=(2,), k_shape=(2, 4), dtype=tf.float32, order=ORDER.DESCENDING)
+
+    # 1
+    v = tf.convert_to_tensor([[1, 1, 1, 1, 1], [-1, -1, -1, -1, -1]], dtype=tf.float32)
+    k = tf.convert_to_tensor([[2, 2], [3, 3], [4, 4], [5, 5], [6, 6]], dtype=tf.float32)
+    bsd.add_all_shared(k, v)
+
+    # 2
+    v = tf.convert_to_tensor([[-1, 1, -1, -1, -1], [-1, -1, -1, -1, -1]], dtype=tf.float32) * 2
+    k = tf.convert_to_tensor([[2, 2], [3, 3], [4, 4], [5, 5], [6, 6]], dtype=tf.float32) * 10
+    bsd.add_all_shared(k, v)
+
+    # 3
+    v = tf.convert_to_tensor([[-1, -1, 1, 1, 1], [1, 1, 1, -1, -1]], dtype=tf.float32) * 3
+    k = tf.convert_to_tensor([[2, 2], [3, 3], [4, 4], [5, 5], [6, 6]], dtype=tf.float32) * 100
+    bsd.add_all_shared(k, v)
+
+    # 4
+    v = tf.convert_to_tensor([[-1, -1, -1, -1, -1], [-1, -1, -1, 1, -1]], dtype=tf.float32) * 2.5
+    k = tf.convert_to_tensor([[2, 2], [3, 3], [4, 4], [5, 5], [6, 6]], dtype=tf.float32) * 1000
+    bsd.add_all_shared(k, v)
+
+    key, k = bsd.get()
+
+    values_expected = tf.convert_to_tensor([[3., 3., 3., 2.], [3., 3., 3.0, 2.5]])
+
+    key_expected = tf.convert_to_tensor([[[400, 400], [500, 500], [600, 600], [30, 30]],
+                                         [[200, 200], [300, 300], [400, 400], [5000, 5000]]], dtype=tf.float32)
+
+    assert tf.reduce_max(tf.abs(key - key_expected)) < 1E-6
+    assert tf.reduce_max(tf.abs(k - values_expected)) < 1E-6
+
+
 def test_batched_sorted_dict_3():
     bsd = BatchSort(batch_shape=(2,), k_shape=(2, 4), dtype=tf.float32, order=ORDER.DESCENDING)
 
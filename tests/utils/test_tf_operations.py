@@ -6,7 +6,8 @@ import numpy as np
 import tensorflow as tf
 from tensorflow.keras.layers import Conv2D, MaxPooling2D, Flatten, Dense
 
-from deel.influenciae.utils import find_layer, is_dataset_batched, dataset_to_tensor, array_to_dataset
+from deel.influenciae.utils import find_layer, is_dataset_batched, dataset_to_tensor, array_to_dataset, \
+    blocked_matmul
 
 
 def test_find_layer():
@@ -68,3 +69,16 @@ def test_array_to_dataset():
     r_ds = array_to_dataset(r, batch_size=5, shuffle=True, buffer_size=25)
     r_sorted = tf.sort(tf.concat([b for b in r_ds], axis=0))
     assert tf.reduce_all(r == r_sorted)
+
+
+def test_blocked_matmul():
+    # Check that the tiled accumulation matches a single full matmul, for block sizes that
+    # divide the inner dimension, don't, or exceed it
+    a = tf.random.normal((4, 37))
+    b = tf.random.normal((6, 37))
+    expected = tf.matmul(a, tf.transpose(b))
+
+    for block_size in [1, 5, 37, 64]:
+        result = blocked_matmul(a, b, block_size)
+        assert result.shape == (4, 6)
+        assert np.allclose(result.numpy(), expected.numpy(), atol=1e-5)